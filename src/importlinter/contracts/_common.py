@@ -8,9 +8,11 @@ without warning.
 
 from __future__ import annotations
 
+from copy import deepcopy
 from dataclasses import dataclass
 import itertools
-from typing import List, Optional, Sequence, Tuple, Union
+import sys
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 import grimp
 from grimp import ImportGraph
@@ -19,8 +21,23 @@ from typing_extensions import TypedDict
 from importlinter.application import output
 from importlinter.domain.imports import Module
 
+if sys.version_info >= (3, 10):
+    from itertools import pairwise
+else:
 
-class Link(TypedDict):
+    def pairwise(iterable):
+        """
+        Return successive overlapping pairs taken from the input iterable.
+        pairwise('ABCDEFG') --> AB BC CD DE EF FG
+
+        TODO: Remove once Python 3.9 support is dropped.
+        """
+        a, b = itertools.tee(iterable)
+        next(b, None)
+        return zip(a, b)
+
+
+class Link(NamedTuple):
     importer: str
     imported: str
     # If the graph has been built manually, we may not know the line number.
@@ -29,6 +46,9 @@ class Link(TypedDict):
 
 Chain = List[Link]
 
+# Line numbers keyed by (importer, imported), shared across routes built from the same graph.
+LineNumbersCache = Dict[Tuple[str, str], Tuple[Optional[int], ...]]
+
 
 class DetailedChain(TypedDict):
     chain: Chain
@@ -38,6 +58,9 @@ class DetailedChain(TypedDict):
 
 @dataclass
 class ImportNote:
+    # Declared manually rather than with dataclass(slots=True), which needs Python 3.10.
+    __slots__ = ("module", "msg", "line_numbers")
+
     module: str
     msg: str
     line_numbers: Tuple[Optional[int], ...]
@@ -56,88 +79,91 @@ def render_notes_from_chain_data(notes: list[ImportNote]) -> None:
 
 def notes_from_chain_data(chain_data: DetailedChain) -> list[ImportNote]:
     main_chain = chain_data["chain"]
+    if len(main_chain) == 1:
+        # The only import is both the first and the last. The usual head and tail layout can't
+        # show both sets of extra imports against a single import, so list every import in full.
+        links = [main_chain[0], *chain_data["extra_firsts"], *chain_data["extra_lasts"]]
+        return [
+            ImportNote(
+                link.importer,
+                f"{'& ' if position else ''}{link.importer} -> {link.imported}",
+                link.line_numbers,
+            )
+            for position, link in enumerate(links)
+        ]
+
     notes = _notes_from_direct_import(main_chain[0], extra_firsts=chain_data["extra_firsts"])
 
-    for direct_import in main_chain[1:-1]:
+    for direct_import in itertools.islice(main_chain, 1, len(main_chain) - 1):
         notes.extend(_notes_from_direct_import(direct_import))
 
-    if len(main_chain) > 1:
-        notes.extend(
-            _notes_from_direct_import(main_chain[-1], extra_lasts=chain_data["extra_lasts"])
-        )
+    notes.extend(_notes_from_direct_import(main_chain[-1], extra_lasts=chain_data["extra_lasts"]))
 
     return notes
 
 
 def find_segments(
-    graph: ImportGraph, reference_graph: ImportGraph, importer: Module, imported: Module
-) -> List[Chain]:
+    graph: ImportGraph, importer: Module, imported: Module, copy_graph: bool = True
+) -> Iterator[Chain]:
     """
-    Return list of headless and tailless chains.
+    Yield headless and tailless chains, shortest first.
 
-    Two graphs are passed in: the first is mutated, the second is used purely as a reference to
-    look up import details which are otherwise removed during mutation.
+    Chains are found lazily, so a caller that stops iterating early avoids searching for the
+    remaining ones.
+
+    By default the supplied graph is not mutated: chains are popped from a private copy, while
+    import details are looked up in the original graph. Callers that pass a graph they no longer
+    need can set copy_graph to False to avoid the cost of the copy; the imports in each chain
+    are then removed from the graph passed in, after their details have been looked up.
     """
-    segments = []
-    for chain in _pop_shortest_chains(graph, importer=importer.name, imported=imported.name):
-        if len(chain) == 2:
+    search_graph = deepcopy(graph) if copy_graph else graph
+    for chain in _pop_shortest_chains(
+        search_graph, importer=importer.name, imported=imported.name
+    ):
+        chain_length = len(chain)
+        if chain_length == 2:
             raise ValueError("Direct chain found - these should have been removed.")
-        segment: List[Link] = []
-        for importer_in_chain, imported_in_chain in [
-            (chain[i], chain[i + 1]) for i in range(len(chain) - 1)
-        ]:
-            import_details = reference_graph.get_import_details(
-                importer=importer_in_chain, imported=imported_in_chain
-            )
-            line_numbers = tuple(sorted(set(j["line_number"] for j in import_details)))
-            segment.append(
-                {
-                    "importer": importer_in_chain,
-                    "imported": imported_in_chain,
-                    "line_numbers": line_numbers,
-                }
-            )
-        segments.append(segment)
-    return segments
+        if chain_length == 3:
+            # Most segments are a single module between the head and tail, so special-case it.
+            first, middle, last = map(sys.intern, chain)
+            yield [_build_link(graph, first, middle), _build_link(graph, middle, last)]
+        else:
+            yield [
+                _build_link(graph, importer_in_chain, imported_in_chain)
+                for importer_in_chain, imported_in_chain in pairwise(map(sys.intern, chain))
+            ]
+
+
+def _build_link(graph: ImportGraph, importer: str, imported: str) -> Link:
+    return Link(
+        importer=importer,
+        imported=imported,
+        line_numbers=_dedup_sort_lines(
+            graph.get_import_details(importer=importer, imported=imported)
+        ),
+    )
 
 
 def segments_to_collapsed_chains(
-    graph: ImportGraph, segments: List[Chain], importer: Module, imported: Module
+    graph: ImportGraph, segments: Iterable[Chain], importer: Module, imported: Module
 ) -> List[DetailedChain]:
+    # The segments are iterated more than once, and may be a generator from find_segments.
+    segments = list(segments)
+    # Segments often share boundary modules, so look up the head and tail imports once for
+    # each distinct boundary module.
+    head_imports_by_module = {
+        imported_module: _find_head_imports(graph, imported_module, importer)
+        for imported_module in {segment[0].imported for segment in segments}
+    }
+    tail_imports_by_module = {
+        importer_module: _find_tail_imports(graph, importer_module, imported)
+        for importer_module in {segment[-1].importer for segment in segments}
+    }
+
     collapsed_chains: List[DetailedChain] = []
     for segment in segments:
-        head_imports: List[Link] = []
-        imported_module = segment[0]["imported"]
-        candidate_modules = sorted(graph.find_modules_that_directly_import(imported_module))
-        for module in [
-            m
-            for m in candidate_modules
-            if Module(m) == importer or Module(m).is_descendant_of(importer)
-        ]:
-            import_details_list = graph.get_import_details(
-                importer=module, imported=imported_module
-            )
-            line_numbers = tuple(sorted(set(j["line_number"] for j in import_details_list)))
-            head_imports.append(
-                {"importer": module, "imported": imported_module, "line_numbers": line_numbers}
-            )
-
-        tail_imports: List[Link] = []
-        importer_module = segment[-1]["importer"]
-        candidate_modules = sorted(graph.find_modules_directly_imported_by(importer_module))
-        for module in [
-            m
-            for m in candidate_modules
-            if Module(m) == imported or Module(m).is_descendant_of(imported)
-        ]:
-            import_details_list = graph.get_import_details(
-                importer=importer_module, imported=module
-            )
-            line_numbers = tuple(sorted(set(j["line_number"] for j in import_details_list)))
-            tail_imports.append(
-                {"importer": importer_module, "imported": module, "line_numbers": line_numbers}
-            )
-
+        head_imports = head_imports_by_module[segment[0].imported]
+        tail_imports = tail_imports_by_module[segment[-1].importer]
         collapsed_chains.append(
             {
                 "chain": [head_imports[0]] + segment[1:-1] + [tail_imports[0]],
@@ -149,15 +175,77 @@ def segments_to_collapsed_chains(
     return collapsed_chains
 
 
+def _find_head_imports(graph: ImportGraph, imported_module: str, importer: Module) -> List[Link]:
+    """
+    Return the imports of the imported module by the importer or any of its descendants.
+    """
+    get_import_details = graph.get_import_details
+    # Filter before sorting, as most importers of a module are usually unrelated.
+    candidate_modules = sorted(
+        sys.intern(m)
+        for m in graph.find_modules_that_directly_import(imported_module)
+        if _is_descendant_name(m, importer.name)
+    )
+    return [
+        Link(
+            importer=module,
+            imported=imported_module,
+            line_numbers=_dedup_sort_lines(
+                get_import_details(importer=module, imported=imported_module)
+            ),
+        )
+        for module in candidate_modules
+    ]
+
+
+def _find_tail_imports(graph: ImportGraph, importer_module: str, imported: Module) -> List[Link]:
+    """
+    Return the imports by the importer module of the imported or any of its descendants.
+    """
+    get_import_details = graph.get_import_details
+    candidate_modules = sorted(
+        sys.intern(m)
+        for m in graph.find_modules_directly_imported_by(importer_module)
+        if _is_descendant_name(m, imported.name)
+    )
+    return [
+        Link(
+            importer=importer_module,
+            imported=module,
+            line_numbers=_dedup_sort_lines(
+                get_import_details(importer=importer_module, imported=module)
+            ),
+        )
+        for module in candidate_modules
+    ]
+
+
+def _is_descendant_name(name: str, ancestor: str) -> bool:
+    """
+    Return whether the module name is the ancestor, or a descendant of it.
+
+    This works on the names directly, to avoid constructing Module objects in tight loops.
+    """
+    return name == ancestor or name.startswith(ancestor + ".")
+
+
 def _pop_shortest_chains(graph: ImportGraph, importer: str, imported: str):
-    chain: Union[Optional[Tuple[str, ...]], bool] = True
-    while chain:
+    """
+    Yield every shortest chain between the importer and imported, one at a time.
+
+    grimp's find_shortest_chains only returns one chain per importer/imported pair, so
+    instead each chain is removed from the graph once it has been consumed, exposing the next
+    one. The graph is mutated.
+    """
+    while True:
         chain = graph.find_shortest_chain(importer, imported)
-        if chain:
-            # Remove chain of imports from graph.
-            for index in range(len(chain) - 1):
-                graph.remove_import(importer=chain[index], imported=chain[index + 1])
-            yield chain
+        if not chain:
+            return
+        yield chain
+        # Only remove the chain of imports once the caller has finished with it, so that its
+        # import details can still be looked up in the same graph.
+        for index in range(len(chain) - 1):
+            graph.remove_import(importer=chain[index], imported=chain[index + 1])
 
 
 def format_line_numbers(line_numbers: Sequence[Optional[int]]) -> str:
@@ -167,8 +255,11 @@ def format_line_numbers(line_numbers: Sequence[Optional[int]]) -> str:
     Unknown line numbers should be provided as a None value in the sequence. E.g.
     (None,) will be returned as "l.?".
     """
+    if len(line_numbers) == 1:
+        line_number = line_numbers[0]
+        return "l.?" if line_number is None else "l." + str(line_number)
     return ", ".join(
-        "l.?" if line_number is None else f"l.{line_number}" for line_number in line_numbers
+        ["l.?" if line_number is None else "l." + str(line_number) for line_number in line_numbers]
     )
 
 
@@ -182,80 +273,110 @@ def _notes_from_direct_import(
     if extra_firsts:
         for position, source in enumerate([direct_import] + extra_firsts[:-1]):
             prefix = "& " if position > 0 else ""
-            importer = source["importer"]
-            note = ImportNote(importer, f"{prefix}{importer}", source["line_numbers"])
+            importer = source.importer
+            note = ImportNote(importer, f"{prefix}{importer}", source.line_numbers)
             import_notes.append(note)
-        importer, imported = extra_firsts[-1]["importer"], extra_firsts[-1]["imported"]
-        note = ImportNote(importer, f"& {importer} -> {imported}", extra_firsts[-1]["line_numbers"])
+        importer, imported = extra_firsts[-1].importer, extra_firsts[-1].imported
+        note = ImportNote(importer, f"& {importer} -> {imported}", extra_firsts[-1].line_numbers)
         import_notes.append(note)
     else:
-        importer, imported = direct_import["importer"], direct_import["imported"]
-        note = ImportNote(importer, f"{importer} -> {imported}", direct_import["line_numbers"])
+        importer, imported = direct_import.importer, direct_import.imported
+        note = ImportNote(importer, f"{importer} -> {imported}", direct_import.line_numbers)
         import_notes.append(note)
 
     if extra_lasts:
-        importer = direct_import["importer"]
+        importer = direct_import.importer
         indent_string = (len(importer) + 4) * " "
         for destination in extra_lasts:
-            imported = destination["imported"]
-            note = ImportNote(importer, f"{indent_string}& {imported}", destination["line_numbers"])
+            imported = destination.imported
+            note = ImportNote(importer, f"{indent_string}& {imported}", destination.line_numbers)
             import_notes.append(note)
 
     return import_notes
 
 
-def build_detailed_chain_from_route(route: grimp.Route, graph: grimp.ImportGraph) -> DetailedChain:
-    ordered_heads = sorted(route.heads)
-    extra_firsts: list[Link] = [
-        {
-            "importer": head,
-            "imported": route.middle[0],
-            "line_numbers": get_line_numbers(importer=head, imported=route.middle[0], graph=graph),
-        }
-        for head in ordered_heads[1:]
-    ]
-    ordered_tails = sorted(route.tails)
-    extra_lasts: list[Link] = [
-        {
-            "imported": tail,
-            "importer": route.middle[-1],
-            "line_numbers": get_line_numbers(
-                imported=tail, importer=route.middle[-1], graph=graph
-            ),
-        }
-        for tail in ordered_tails[1:]
-    ]
-    chain_as_strings = [ordered_heads[0], *route.middle, ordered_tails[0]]
-    chain_as_links: Chain = [
-        {
-            "importer": importer,
-            "imported": imported,
-            "line_numbers": get_line_numbers(importer=importer, imported=imported, graph=graph),
-        }
-        for importer, imported in pairwise(chain_as_strings)
-    ]
+def build_detailed_chain_from_route(
+    route: grimp.Route,
+    graph: grimp.ImportGraph,
+    line_numbers_cache: Optional[LineNumbersCache] = None,
+) -> DetailedChain:
+    """
+    Build a DetailedChain from a grimp Route.
+
+    If a line_numbers_cache is passed, it will be used to avoid looking up the same import
+    details more than once. The cache must only be shared between calls using the same graph.
+    """
+    # Module names recur across many links and line number cache keys, so intern them.
+    ordered_heads = sorted(map(sys.intern, route.heads))
+    ordered_tails = sorted(map(sys.intern, route.tails))
+    middle = [sys.intern(module) for module in route.middle]
+    extra_first_edges = [(head, middle[0]) for head in ordered_heads[1:]]
+    extra_last_edges = [(middle[-1], tail) for tail in ordered_tails[1:]]
+    chain_edges = list(pairwise([ordered_heads[0], *middle, ordered_tails[0]]))
+
+    line_numbers = _prefetch_line_numbers(
+        graph,
+        itertools.chain(chain_edges, extra_first_edges, extra_last_edges),
+        cache=line_numbers_cache,
+    )
+
+    def to_links(edges: List[Tuple[str, str]]) -> List[Link]:
+        return [
+            Link(
+                importer=importer,
+                imported=imported,
+                line_numbers=line_numbers[(importer, imported)],
+            )
+            for importer, imported in edges
+        ]
+
     return {
-        "chain": chain_as_links,
-        "extra_firsts": extra_firsts,
-        "extra_lasts": extra_lasts,
+        "chain": to_links(chain_edges),
+        "extra_firsts": to_links(extra_first_edges),
+        "extra_lasts": to_links(extra_last_edges),
     }
 
 
+def _prefetch_line_numbers(
+    graph: grimp.ImportGraph,
+    edges: Iterable[Tuple[str, str]],
+    cache: Optional[LineNumbersCache] = None,
+) -> LineNumbersCache:
+    """
+    Look up the line numbers for all the supplied (importer, imported) edges in a single pass.
+
+    If a cache is passed, it is populated and returned; otherwise a new dictionary is returned.
+    """
+    line_numbers: LineNumbersCache = {} if cache is None else cache
+    for importer, imported in edges:
+        get_line_numbers(importer=importer, imported=imported, graph=graph, cache=line_numbers)
+    return line_numbers
+
+
 def get_line_numbers(
-    importer: str, imported: str, graph: grimp.ImportGraph
+    importer: str,
+    imported: str,
+    graph: grimp.ImportGraph,
+    cache: Optional[LineNumbersCache] = None,
 ) -> tuple[int | None, ...]:
+    if cache is not None:
+        try:
+            return cache[(importer, imported)]
+        except KeyError:
+            pass
     details = graph.get_import_details(importer=importer, imported=imported)
-    line_numbers = tuple(i["line_number"] for i in details) if details else (None,)
+    line_numbers = _dedup_sort_lines(details) if details else (None,)
+    if cache is not None:
+        cache[(importer, imported)] = line_numbers
     return line_numbers
 
 
-def pairwise(iterable):
+def _dedup_sort_lines(import_details: Sequence[grimp.DetailedImport]) -> Tuple[int, ...]:
     """
-    Return successive overlapping pairs taken from the input iterable.
-    pairwise('ABCDEFG') --> AB BC CD DE EF FG
-
-    TODO: Replace with itertools.pairwise once on Python 3.10.
+    Return the distinct line numbers from the supplied import details, in ascending order.
     """
-    a, b = itertools.tee(iterable)
-    next(b, None)
-    return zip(a, b)
+    line_numbers = {details["line_number"] for details in import_details}
+    if len(line_numbers) == 1:
+        # Most imports happen on a single line, so don't bother sorting.
+        return (next(iter(line_numbers)),)
+    return tuple(sorted(line_numbers))
@@ -15,8 +15,10 @@ from importlinter.domain.imports import Module
 
 from ._common import (
     DetailedChain,
+    LineNumbersCache,
     Link,
     build_detailed_chain_from_route,
+    get_line_numbers,
     notes_from_chain_data,
     render_notes_from_chain_data,
 )
@@ -108,11 +110,15 @@ class IndependenceContract(Contract):
     def _build_invalid_chains(
         self, dependencies: set[grimp.PackageDependency], graph: grimp.ImportGraph
     ) -> list[_SubpackageChainData]:
+        line_numbers_cache: LineNumbersCache = {}
         return [
             {
                 "upstream_module": dependency.imported,
                 "downstream_module": dependency.importer,
-                "chains": [build_detailed_chain_from_route(c, graph) for c in dependency.routes],
+                "chains": [
+                    build_detailed_chain_from_route(c, graph, line_numbers_cache)
+                    for c in dependency.routes
+                ],
             }
             for dependency in dependencies
         ]
@@ -138,14 +144,11 @@ class IndependenceContract(Contract):
                 for importer, imported in [
                     (chain[i], chain[i + 1]) for i in range(len(chain) - 1)
                 ]:
-                    import_details = graph.get_import_details(importer=importer, imported=imported)
-                    line_numbers = tuple(j["line_number"] for j in import_details)
+                    line_numbers = get_line_numbers(
+                        importer=importer, imported=imported, graph=graph
+                    )
                     chain_data.append(
-                        {
-                            "importer": importer,
-                            "imported": imported,
-                            "line_numbers": line_numbers,
-                        }
+                        Link(importer=importer, imported=imported, line_numbers=line_numbers)
                     )
                 detailed_chain: DetailedChain = {
                     "chain": chain_data,
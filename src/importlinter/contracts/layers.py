@@ -16,6 +16,7 @@ from importlinter.domain.imports import Module
 from ._common import (
     DetailedChain,
     ImportNote,
+    LineNumbersCache,
     build_detailed_chain_from_route,
     notes_from_chain_data,
     render_notes_from_chain_data,
@@ -314,11 +315,15 @@ class LayersContract(Contract):
     def _build_invalid_chains(
         self, dependencies: set[grimp.PackageDependency], graph: grimp.ImportGraph
     ) -> list[_LayerChainData]:
+        line_numbers_cache: LineNumbersCache = {}
         return [
             {
                 "imported": dependency.imported,
                 "importer": dependency.importer,
-                "routes": [build_detailed_chain_from_route(c, graph) for c in dependency.routes],
+                "routes": [
+                    build_detailed_chain_from_route(c, graph, line_numbers_cache)
+                    for c in dependency.routes
+                ],
             }
             for dependency in dependencies
         ]
@@ -0,0 +1,311 @@
+from unittest.mock import Mock
+
+import pytest
+from grimp.adaptors.graph import ImportGraph
+
+from importlinter.contracts._common import (
+    DetailedChain,
+    ImportNote,
+    Link,
+    find_segments,
+    format_line_numbers,
+    get_line_numbers,
+    notes_from_chain_data,
+    segments_to_collapsed_chains,
+)
+from importlinter.domain.imports import Module
+
+
+class TestGetLineNumbers:
+    def _build_graph(self) -> ImportGraph:
+        graph = ImportGraph()
+        graph.add_import(
+            importer="mypackage.blue",
+            imported="mypackage.green",
+            line_number=3,
+            line_contents="import mypackage.green",
+        )
+        graph.add_import(importer="mypackage.green", imported="mypackage.yellow")
+        return graph
+
+    def test_returns_line_numbers(self):
+        graph = self._build_graph()
+
+        assert get_line_numbers(
+            importer="mypackage.blue", imported="mypackage.green", graph=graph
+        ) == (3,)
+
+    def test_returns_distinct_line_numbers_in_order(self):
+        graph = self._build_graph()
+        for line_number in (8, 3, 5):
+            graph.add_import(
+                importer="mypackage.blue",
+                imported="mypackage.green",
+                line_number=line_number,
+                line_contents="import mypackage.green",
+            )
+
+        assert get_line_numbers(
+            importer="mypackage.blue", imported="mypackage.green", graph=graph
+        ) == (3, 5, 8)
+
+    def test_returns_none_for_unknown_line_numbers(self):
+        graph = self._build_graph()
+
+        assert get_line_numbers(
+            importer="mypackage.green", imported="mypackage.yellow", graph=graph
+        ) == (None,)
+
+    def test_uses_cache(self):
+        graph = self._build_graph()
+        graph.get_import_details = Mock(wraps=graph.get_import_details)
+        cache: dict = {}
+
+        for _ in range(2):
+            assert get_line_numbers(
+                importer="mypackage.blue", imported="mypackage.green", graph=graph, cache=cache
+            ) == (3,)
+
+        graph.get_import_details.assert_called_once_with(
+            importer="mypackage.blue", imported="mypackage.green"
+        )
+        assert cache == {("mypackage.blue", "mypackage.green"): (3,)}
+
+
+class TestFindSegments:
+    def _build_graph(self) -> ImportGraph:
+        graph = ImportGraph()
+        for importer, imported, line_number in (
+            ("mypackage.blue", "mypackage.green", 1),
+            ("mypackage.green", "mypackage.red", 2),
+            ("mypackage.blue", "mypackage.yellow", 3),
+            ("mypackage.yellow", "mypackage.orange", 4),
+            ("mypackage.orange", "mypackage.red", 5),
+        ):
+            graph.add_import(
+                importer=importer,
+                imported=imported,
+                line_number=line_number,
+                line_contents=f"import {imported}",
+            )
+        return graph
+
+    def test_returns_all_segments_in_order_of_length(self):
+        graph = self._build_graph()
+
+        segments = list(
+            find_segments(
+                graph, importer=Module("mypackage.blue"), imported=Module("mypackage.red")
+            )
+        )
+
+        assert segments == [
+            [
+                Link(importer="mypackage.blue", imported="mypackage.green", line_numbers=(1,)),
+                Link(importer="mypackage.green", imported="mypackage.red", line_numbers=(2,)),
+            ],
+            [
+                Link(importer="mypackage.blue", imported="mypackage.yellow", line_numbers=(3,)),
+                Link(importer="mypackage.yellow", imported="mypackage.orange", line_numbers=(4,)),
+                Link(importer="mypackage.orange", imported="mypackage.red", line_numbers=(5,)),
+            ],
+        ]
+
+    def test_does_not_mutate_graph(self):
+        graph = self._build_graph()
+
+        list(
+            find_segments(
+                graph, importer=Module("mypackage.blue"), imported=Module("mypackage.red")
+            )
+        )
+
+        assert graph.count_imports() == 5
+
+    def test_can_search_graph_without_copying(self):
+        graph = self._build_graph()
+
+        segments = list(
+            find_segments(
+                graph,
+                importer=Module("mypackage.blue"),
+                imported=Module("mypackage.red"),
+                copy_graph=False,
+            )
+        )
+
+        assert segments == list(
+            find_segments(
+                self._build_graph(),
+                importer=Module("mypackage.blue"),
+                imported=Module("mypackage.red"),
+            )
+        )
+        assert graph.count_imports() == 0
+
+
+class TestSegmentsToCollapsedChains:
+    def test_collapses_heads_and_tails(self):
+        graph = ImportGraph()
+        for importer, imported, line_number in (
+            ("mypackage.blue.one", "mypackage.green", 1),
+            ("mypackage.blue.two", "mypackage.green", 2),
+            ("mypackage.bluebird", "mypackage.green", 3),
+            ("mypackage.green", "mypackage.yellow", 4),
+            ("mypackage.green", "mypackage.orange", 5),
+            ("mypackage.yellow", "mypackage.red", 6),
+            ("mypackage.yellow", "mypackage.red.one", 7),
+            ("mypackage.orange", "mypackage.red", 8),
+        ):
+            graph.add_import(
+                importer=importer,
+                imported=imported,
+                line_number=line_number,
+                line_contents=f"import {imported}",
+            )
+        segments = [
+            [
+                Link(importer="mypackage.blue", imported="mypackage.green", line_numbers=()),
+                Link(importer="mypackage.green", imported="mypackage.yellow", line_numbers=(4,)),
+                Link(importer="mypackage.yellow", imported="mypackage.red", line_numbers=()),
+            ],
+            [
+                Link(importer="mypackage.blue", imported="mypackage.green", line_numbers=()),
+                Link(importer="mypackage.green", imported="mypackage.orange", line_numbers=(5,)),
+                Link(importer="mypackage.orange", imported="mypackage.red", line_numbers=()),
+            ],
+        ]
+
+        result = segments_to_collapsed_chains(
+            graph, segments, importer=Module("mypackage.blue"), imported=Module("mypackage.red")
+        )
+
+        head_import = Link(
+            importer="mypackage.blue.one", imported="mypackage.green", line_numbers=(1,)
+        )
+        extra_firsts = [
+            Link(importer="mypackage.blue.two", imported="mypackage.green", line_numbers=(2,))
+        ]
+        assert result == [
+            {
+                "chain": [
+                    head_import,
+                    segments[0][1],
+                    Link(importer="mypackage.yellow", imported="mypackage.red", line_numbers=(6,)),
+                ],
+                "extra_firsts": extra_firsts,
+                "extra_lasts": [
+                    Link(
+                        importer="mypackage.yellow",
+                        imported="mypackage.red.one",
+                        line_numbers=(7,),
+                    )
+                ],
+            },
+            {
+                "chain": [
+                    head_import,
+                    segments[1][1],
+                    Link(importer="mypackage.orange", imported="mypackage.red", line_numbers=(8,)),
+                ],
+                "extra_firsts": extra_firsts,
+                "extra_lasts": [],
+            },
+        ]
+
+    def test_accepts_segments_from_find_segments_directly(self):
+        graph = ImportGraph()
+        graph.add_import(
+            importer="mypackage.blue",
+            imported="mypackage.green",
+            line_number=1,
+            line_contents="import mypackage.green",
+        )
+        graph.add_import(
+            importer="mypackage.green",
+            imported="mypackage.red",
+            line_number=2,
+            line_contents="import mypackage.red",
+        )
+        importer, imported = Module("mypackage.blue"), Module("mypackage.red")
+
+        result = segments_to_collapsed_chains(
+            graph,
+            find_segments(graph, importer=importer, imported=imported),
+            importer=importer,
+            imported=imported,
+        )
+
+        assert result == [
+            {
+                "chain": [
+                    Link(importer="mypackage.blue", imported="mypackage.green", line_numbers=(1,)),
+                    Link(importer="mypackage.green", imported="mypackage.red", line_numbers=(2,)),
+                ],
+                "extra_firsts": [],
+                "extra_lasts": [],
+            }
+        ]
+
+
+class TestNotesFromChainData:
+    def test_single_link_chain(self):
+        chain_data: DetailedChain = {
+            "chain": [
+                Link(importer="mypackage.blue", imported="mypackage.red", line_numbers=(1,))
+            ],
+            "extra_firsts": [],
+            "extra_lasts": [],
+        }
+
+        assert notes_from_chain_data(chain_data) == [
+            ImportNote("mypackage.blue", "mypackage.blue -> mypackage.red", (1,)),
+        ]
+
+    def test_single_link_chain_lists_extra_firsts_and_lasts_in_full(self):
+        chain_data: DetailedChain = {
+            "chain": [
+                Link(importer="mypackage.blue", imported="mypackage.red", line_numbers=(1,))
+            ],
+            "extra_firsts": [
+                Link(importer="mypackage.blue.one", imported="mypackage.red", line_numbers=(2,))
+            ],
+            "extra_lasts": [
+                Link(importer="mypackage.blue", imported="mypackage.red.one", line_numbers=(3,))
+            ],
+        }
+
+        assert notes_from_chain_data(chain_data) == [
+            ImportNote("mypackage.blue", "mypackage.blue -> mypackage.red", (1,)),
+            ImportNote("mypackage.blue.one", "& mypackage.blue.one -> mypackage.red", (2,)),
+            ImportNote("mypackage.blue", "& mypackage.blue -> mypackage.red.one", (3,)),
+        ]
+
+    def test_multiple_link_chain(self):
+        chain_data: DetailedChain = {
+            "chain": [
+                Link(importer="mypackage.blue", imported="mypackage.green", line_numbers=(1,)),
+                Link(importer="mypackage.green", imported="mypackage.red", line_numbers=(2,)),
+            ],
+            "extra_firsts": [],
+            "extra_lasts": [],
+        }
+
+        assert notes_from_chain_data(chain_data) == [
+            ImportNote("mypackage.blue", "mypackage.blue -> mypackage.green", (1,)),
+            ImportNote("mypackage.green", "mypackage.green -> mypackage.red", (2,)),
+        ]
+
+
+@pytest.mark.parametrize(
+    "line_numbers, expected",
+    (
+        ((), ""),
+        ((None,), "l.?"),
+        ((3,), "l.3"),
+        ((3, 10), "l.3, l.10"),
+        ((None, 10), "l.?, l.10"),
+    ),
+)
+def test_format_line_numbers(line_numbers, expected):
+    assert format_line_numbers(line_numbers) == expected
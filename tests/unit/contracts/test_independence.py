@@ -4,6 +4,7 @@ import pytest
 from grimp.adaptors.graph import ImportGraph
 
 from importlinter.application.app_config import settings
+from importlinter.contracts._common import Link
 from importlinter.contracts.independence import IndependenceContract, _SubpackageChainData
 from importlinter.domain.contract import ContractCheck
 from tests.adapters.printing import FakePrinter
@@ -108,11 +109,11 @@ class TestIndependenceContract:
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.blue",
-                                    "imported": "mypackage.green",
-                                    "line_numbers": (10,),
-                                }
+                                Link(
+                                    importer="mypackage.blue",
+                                    imported="mypackage.green",
+                                    line_numbers=(10,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -150,16 +151,16 @@ class TestIndependenceContract:
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.blue",
-                                    "imported": "mypackage.other",
-                                    "line_numbers": (10,),
-                                },
-                                {
-                                    "importer": "mypackage.other",
-                                    "imported": "mypackage.green",
-                                    "line_numbers": (11,),
-                                },
+                                Link(
+                                    importer="mypackage.blue",
+                                    imported="mypackage.other",
+                                    line_numbers=(10,),
+                                ),
+                                Link(
+                                    importer="mypackage.other",
+                                    imported="mypackage.green",
+                                    line_numbers=(11,),
+                                ),
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -197,11 +198,11 @@ class TestIndependenceContract:
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.yellow",
-                                    "imported": "mypackage.blue",
-                                    "line_numbers": (11,),
-                                }
+                                Link(
+                                    importer="mypackage.yellow",
+                                    imported="mypackage.blue",
+                                    line_numbers=(11,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -214,11 +215,11 @@ class TestIndependenceContract:
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.blue",
-                                    "imported": "mypackage.green",
-                                    "line_numbers": (10,),
-                                }
+                                Link(
+                                    importer="mypackage.blue",
+                                    imported="mypackage.green",
+                                    line_numbers=(10,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -252,11 +253,11 @@ class TestIndependenceContract:
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.blue.alpha",
-                                    "imported": "mypackage.yellow.gamma",
-                                    "line_numbers": (5,),
-                                }
+                                Link(
+                                    importer="mypackage.blue.alpha",
+                                    imported="mypackage.yellow.gamma",
+                                    line_numbers=(5,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -288,11 +289,11 @@ class TestIndependenceContract:
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.blue.beta.foo",
-                                    "imported": "mypackage.green",
-                                    "line_numbers": (8,),
-                                }
+                                Link(
+                                    importer="mypackage.blue.beta.foo",
+                                    imported="mypackage.green",
+                                    line_numbers=(8,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -378,45 +379,45 @@ class TestIndependenceContract:
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.green.bar",
-                                    "imported": "mypackage.orange.bar",
-                                    "line_numbers": (1, 2),
-                                },
-                                {
-                                    "importer": "mypackage.orange.bar",
-                                    "imported": "mypackage.purple",
-                                    "line_numbers": (4,),
-                                },
-                                {
-                                    "importer": "mypackage.purple",
-                                    "imported": "mypackage.blue",
-                                    "line_numbers": (1,),
-                                },
+                                Link(
+                                    importer="mypackage.green.bar",
+                                    imported="mypackage.orange.bar",
+                                    line_numbers=(1, 2),
+                                ),
+                                Link(
+                                    importer="mypackage.orange.bar",
+                                    imported="mypackage.purple",
+                                    line_numbers=(4,),
+                                ),
+                                Link(
+                                    importer="mypackage.purple",
+                                    imported="mypackage.blue",
+                                    line_numbers=(1,),
+                                ),
                             ],
                             "extra_firsts": [
-                                {
-                                    "importer": "mypackage.green.bar.beta",
-                                    "imported": "mypackage.orange.bar",
-                                    "line_numbers": (31,),
-                                },
-                                {
-                                    "importer": "mypackage.green.foo",
-                                    "imported": "mypackage.orange.bar",
-                                    "line_numbers": (15,),
-                                },
+                                Link(
+                                    importer="mypackage.green.bar.beta",
+                                    imported="mypackage.orange.bar",
+                                    line_numbers=(31,),
+                                ),
+                                Link(
+                                    importer="mypackage.green.foo",
+                                    imported="mypackage.orange.bar",
+                                    line_numbers=(15,),
+                                ),
                             ],
                             "extra_lasts": [
-                                {
-                                    "importer": "mypackage.purple",
-                                    "imported": "mypackage.blue.baz.alpha",
-                                    "line_numbers": (3, 16),
-                                },
-                                {
-                                    "importer": "mypackage.purple",
-                                    "imported": "mypackage.blue.foobar",
-                                    "line_numbers": (41,),
-                                },
+                                Link(
+                                    importer="mypackage.purple",
+                                    imported="mypackage.blue.baz.alpha",
+                                    line_numbers=(3, 16),
+                                ),
+                                Link(
+                                    importer="mypackage.purple",
+                                    imported="mypackage.blue.foobar",
+                                    line_numbers=(41,),
+                                ),
                             ],
                         }
                     ],
@@ -427,11 +428,11 @@ class TestIndependenceContract:
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.yellow.foo",
-                                    "imported": "mypackage.green.bar",
-                                    "line_numbers": (15,),
-                                }
+                                Link(
+                                    importer="mypackage.yellow.foo",
+                                    imported="mypackage.green.bar",
+                                    line_numbers=(15,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -530,32 +531,32 @@ def test_render_broken_contract():
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.blue.foo",
-                                    "imported": "mypackage.utils.red",
-                                    "line_numbers": (16, 102),
-                                },
-                                {
-                                    "importer": "mypackage.utils.red",
-                                    "imported": "mypackage.utils.brown",
-                                    "line_numbers": (1,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.brown",
-                                    "imported": "mypackage.yellow.bar",
-                                    "line_numbers": (3,),
-                                },
+                                Link(
+                                    importer="mypackage.blue.foo",
+                                    imported="mypackage.utils.red",
+                                    line_numbers=(16, 102),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.red",
+                                    imported="mypackage.utils.brown",
+                                    line_numbers=(1,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.brown",
+                                    imported="mypackage.yellow.bar",
+                                    line_numbers=(3,),
+                                ),
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
                         },
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.blue.bar",
-                                    "imported": "mypackage.yellow.baz",
-                                    "line_numbers": (5,),
-                                }
+                                Link(
+                                    importer="mypackage.blue.bar",
+                                    imported="mypackage.yellow.baz",
+                                    line_numbers=(5,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -568,11 +569,11 @@ def test_render_broken_contract():
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.yellow.foo",
-                                    "imported": "mypackage.green.bar",
-                                    "line_numbers": (15,),
-                                }
+                                Link(
+                                    importer="mypackage.yellow.foo",
+                                    imported="mypackage.green.bar",
+                                    line_numbers=(15,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -585,45 +586,45 @@ def test_render_broken_contract():
                     "chains": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.brown.foo",
-                                    "imported": "mypackage.green.bar",
-                                    "line_numbers": (15,),
-                                },
-                                {
-                                    "importer": "mypackage.green.bar",
-                                    "imported": "mypackage.yellow.foo",
-                                    "line_numbers": (4,),
-                                },
-                                {
-                                    "importer": "mypackage.yellow.foo",
-                                    "imported": "mypackage.orange.foobar",
-                                    "line_numbers": (41,),
-                                },
+                                Link(
+                                    importer="mypackage.brown.foo",
+                                    imported="mypackage.green.bar",
+                                    line_numbers=(15,),
+                                ),
+                                Link(
+                                    importer="mypackage.green.bar",
+                                    imported="mypackage.yellow.foo",
+                                    line_numbers=(4,),
+                                ),
+                                Link(
+                                    importer="mypackage.yellow.foo",
+                                    imported="mypackage.orange.foobar",
+                                    line_numbers=(41,),
+                                ),
                             ],
                             "extra_firsts": [
-                                {
-                                    "importer": "mypackage.brown.bar.alpha",
-                                    "imported": "mypackage.green.bar",
-                                    "line_numbers": (1, 2),
-                                },
-                                {
-                                    "importer": "mypackage.brown.bar.beta",
-                                    "imported": "mypackage.green.bar",
-                                    "line_numbers": (31,),
-                                },
+                                Link(
+                                    importer="mypackage.brown.bar.alpha",
+                                    imported="mypackage.green.bar",
+                                    line_numbers=(1, 2),
+                                ),
+                                Link(
+                                    importer="mypackage.brown.bar.beta",
+                                    imported="mypackage.green.bar",
+                                    line_numbers=(31,),
+                                ),
                             ],
                             "extra_lasts": [
-                                {
-                                    "importer": "mypackage.yellow.foo",
-                                    "imported": "mypackage.orange.delta",
-                                    "line_numbers": (1,),
-                                },
-                                {
-                                    "importer": "mypackage.yellow.foo",
-                                    "imported": "mypackage.orange.gamma",
-                                    "line_numbers": (3, 16),
-                                },
+                                Link(
+                                    importer="mypackage.yellow.foo",
+                                    imported="mypackage.orange.delta",
+                                    line_numbers=(1,),
+                                ),
+                                Link(
+                                    importer="mypackage.yellow.foo",
+                                    imported="mypackage.orange.gamma",
+                                    line_numbers=(3, 16),
+                                ),
                             ],
                         }
                     ],
@@ -2,6 +2,7 @@ import pytest
 from grimp.adaptors.graph import ImportGraph
 
 from importlinter.application.app_config import settings
+from importlinter.contracts._common import Link
 from importlinter.contracts.layers import Layer, LayerField, LayersContract, ModuleTail
 from importlinter.domain.contract import ContractCheck, InvalidContractOptions
 from importlinter.domain.helpers import MissingImport
@@ -177,11 +178,11 @@ class TestLayerContractSiblingLayers:
                         "routes": [
                             {
                                 "chain": [
-                                    {
-                                        "importer": "mypackage.medium_a.blue",
-                                        "imported": "mypackage.medium_b.red",
-                                        "line_numbers": (3,),
-                                    },
+                                    Link(
+                                        importer="mypackage.medium_a.blue",
+                                        imported="mypackage.medium_b.red",
+                                        line_numbers=(3,),
+                                    ),
                                 ],
                                 "extra_firsts": [],
                                 "extra_lasts": [],
@@ -515,21 +516,21 @@ class TestLayerContractPopulatesMetadata:
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.white.gamma",
-                                    "imported": "mypackage.utils.foo",
-                                    "line_numbers": (3,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.foo",
-                                    "imported": "mypackage.utils.bar",
-                                    "line_numbers": (1, 101),
-                                },
-                                {
-                                    "importer": "mypackage.utils.bar",
-                                    "imported": "mypackage.high.yellow.alpha",
-                                    "line_numbers": (13,),
-                                },
+                                Link(
+                                    importer="mypackage.low.white.gamma",
+                                    imported="mypackage.utils.foo",
+                                    line_numbers=(3,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.foo",
+                                    imported="mypackage.utils.bar",
+                                    line_numbers=(1, 101),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.bar",
+                                    imported="mypackage.high.yellow.alpha",
+                                    line_numbers=(13,),
+                                ),
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -542,16 +543,16 @@ class TestLayerContractPopulatesMetadata:
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.black",
-                                    "imported": "mypackage.utils.baz",
-                                    "line_numbers": (2,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.baz",
-                                    "imported": "mypackage.medium.red",
-                                    "line_numbers": (3,),
-                                },
+                                Link(
+                                    importer="mypackage.low.black",
+                                    imported="mypackage.utils.baz",
+                                    line_numbers=(2,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.baz",
+                                    imported="mypackage.medium.red",
+                                    line_numbers=(3,),
+                                ),
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -564,11 +565,11 @@ class TestLayerContractPopulatesMetadata:
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.medium.orange.beta",
-                                    "imported": "mypackage.high.blue",
-                                    "line_numbers": (2,),
-                                }
+                                Link(
+                                    importer="mypackage.medium.orange.beta",
+                                    imported="mypackage.high.blue",
+                                    line_numbers=(2,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -608,28 +609,28 @@ class TestLayerContractPopulatesMetadata:
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.blue",
-                                    "imported": "mypackage.utils.foo",
-                                    "line_numbers": (3,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.foo",
-                                    "imported": "mypackage.high.yellow",
-                                    "line_numbers": (1,),
-                                },
+                                Link(
+                                    importer="mypackage.low.blue",
+                                    imported="mypackage.utils.foo",
+                                    line_numbers=(3,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.foo",
+                                    imported="mypackage.high.yellow",
+                                    line_numbers=(1,),
+                                ),
                             ],
                             "extra_firsts": [
-                                {
-                                    "importer": "mypackage.low.green",
-                                    "imported": "mypackage.utils.foo",
-                                    "line_numbers": (3,),
-                                },
-                                {
-                                    "importer": "mypackage.low.red",
-                                    "imported": "mypackage.utils.foo",
-                                    "line_numbers": (3,),
-                                },
+                                Link(
+                                    importer="mypackage.low.green",
+                                    imported="mypackage.utils.foo",
+                                    line_numbers=(3,),
+                                ),
+                                Link(
+                                    importer="mypackage.low.red",
+                                    imported="mypackage.utils.foo",
+                                    line_numbers=(3,),
+                                ),
                             ],
                             "extra_lasts": [],
                         }
@@ -674,28 +675,28 @@ class TestLayerContractPopulatesMetadata:
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.blue",
-                                    "imported": "mypackage.utils.foo",
-                                    "line_numbers": (3,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.foo",
-                                    "imported": "mypackage.utils.bar",
-                                    "line_numbers": (1,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.bar",
-                                    "imported": "mypackage.high.yellow",
-                                    "line_numbers": (2,),
-                                },
+                                Link(
+                                    importer="mypackage.low.blue",
+                                    imported="mypackage.utils.foo",
+                                    line_numbers=(3,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.foo",
+                                    imported="mypackage.utils.bar",
+                                    line_numbers=(1,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.bar",
+                                    imported="mypackage.high.yellow",
+                                    line_numbers=(2,),
+                                ),
                             ],
                             "extra_firsts": [
-                                {
-                                    "importer": "mypackage.low.green",
-                                    "imported": "mypackage.utils.foo",
-                                    "line_numbers": (3,),
-                                }
+                                Link(
+                                    importer="mypackage.low.green",
+                                    imported="mypackage.utils.foo",
+                                    line_numbers=(3,),
+                                )
                             ],
                             "extra_lasts": [],
                         }
@@ -734,29 +735,29 @@ class TestLayerContractPopulatesMetadata:
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.yellow",
-                                    "imported": "mypackage.utils.foo",
-                                    "line_numbers": (1,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.foo",
-                                    "imported": "mypackage.high.blue",
-                                    "line_numbers": (3,),
-                                },
+                                Link(
+                                    importer="mypackage.low.yellow",
+                                    imported="mypackage.utils.foo",
+                                    line_numbers=(1,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.foo",
+                                    imported="mypackage.high.blue",
+                                    line_numbers=(3,),
+                                ),
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [
-                                {
-                                    "importer": "mypackage.utils.foo",
-                                    "imported": "mypackage.high.green",
-                                    "line_numbers": (3,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.foo",
-                                    "imported": "mypackage.high.red",
-                                    "line_numbers": (3,),
-                                },
+                                Link(
+                                    importer="mypackage.utils.foo",
+                                    imported="mypackage.high.green",
+                                    line_numbers=(3,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.foo",
+                                    imported="mypackage.high.red",
+                                    line_numbers=(3,),
+                                ),
                             ],
                         }
                     ],
@@ -800,29 +801,29 @@ class TestLayerContractPopulatesMetadata:
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.yellow",
-                                    "imported": "mypackage.utils.foo",
-                                    "line_numbers": (1,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.foo",
-                                    "imported": "mypackage.utils.bar",
-                                    "line_numbers": (10,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.bar",
-                                    "imported": "mypackage.high.blue",
-                                    "line_numbers": (3,),
-                                },
+                                Link(
+                                    importer="mypackage.low.yellow",
+                                    imported="mypackage.utils.foo",
+                                    line_numbers=(1,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.foo",
+                                    imported="mypackage.utils.bar",
+                                    line_numbers=(10,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.bar",
+                                    imported="mypackage.high.blue",
+                                    line_numbers=(3,),
+                                ),
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [
-                                {
-                                    "importer": "mypackage.utils.bar",
-                                    "imported": "mypackage.high.green",
-                                    "line_numbers": (3,),
-                                }
+                                Link(
+                                    importer="mypackage.utils.bar",
+                                    imported="mypackage.high.green",
+                                    line_numbers=(3,),
+                                )
                             ],
                         }
                     ],
@@ -873,40 +874,40 @@ class TestLayerContractPopulatesMetadata:
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.blue",
-                                    "imported": "mypackage.utils.foo",
-                                    "line_numbers": (3,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.foo",
-                                    "imported": "mypackage.utils.bar",
-                                    "line_numbers": (1,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.bar",
-                                    "imported": "mypackage.utils.baz",
-                                    "line_numbers": (10,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.baz",
-                                    "imported": "mypackage.high.red",
-                                    "line_numbers": (5,),
-                                },
+                                Link(
+                                    importer="mypackage.low.blue",
+                                    imported="mypackage.utils.foo",
+                                    line_numbers=(3,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.foo",
+                                    imported="mypackage.utils.bar",
+                                    line_numbers=(1,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.bar",
+                                    imported="mypackage.utils.baz",
+                                    line_numbers=(10,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.baz",
+                                    imported="mypackage.high.red",
+                                    line_numbers=(5,),
+                                ),
                             ],
                             "extra_firsts": [
-                                {
-                                    "importer": "mypackage.low.green",
-                                    "imported": "mypackage.utils.foo",
-                                    "line_numbers": (3,),
-                                }
+                                Link(
+                                    importer="mypackage.low.green",
+                                    imported="mypackage.utils.foo",
+                                    line_numbers=(3,),
+                                )
                             ],
                             "extra_lasts": [
-                                {
-                                    "importer": "mypackage.utils.baz",
-                                    "imported": "mypackage.high.yellow",
-                                    "line_numbers": (5,),
-                                }
+                                Link(
+                                    importer="mypackage.utils.baz",
+                                    imported="mypackage.high.yellow",
+                                    line_numbers=(5,),
+                                )
                             ],
                         }
                     ],
@@ -967,11 +968,11 @@ class TestLayerContractPopulatesMetadata:
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.white.gamma",
-                                    "imported": "mypackage.high.yellow.alpha",
-                                    "line_numbers": expected_line_numbers,
-                                }
+                                Link(
+                                    importer="mypackage.low.white.gamma",
+                                    imported="mypackage.high.yellow.alpha",
+                                    line_numbers=expected_line_numbers,
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -1064,7 +1065,7 @@ class TestIgnoreImports:
                 "routes": [
                     {
                         "chain": [
-                            dict(
+                            Link(
                                 importer="mypackage.low.black",
                                 imported="mypackage.medium.orange",
                                 line_numbers=(1,),
@@ -1096,7 +1097,7 @@ class TestIgnoreImports:
                 "routes": [
                     {
                         "chain": [
-                            dict(
+                            Link(
                                 importer="mypackage.low.black",
                                 imported="mypackage.medium.orange",
                                 line_numbers=(1,),
@@ -1317,86 +1318,86 @@ def test_render_broken_contract():
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.blue",
-                                    "imported": "mypackage.high.yellow",
-                                    "line_numbers": (6,),
-                                }
+                                Link(
+                                    importer="mypackage.low.blue",
+                                    imported="mypackage.high.yellow",
+                                    line_numbers=(6,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
                         },
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.green",
-                                    "imported": "mypackage.high.blue",
-                                    "line_numbers": (12,),
-                                }
+                                Link(
+                                    importer="mypackage.low.green",
+                                    imported="mypackage.high.blue",
+                                    line_numbers=(12,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
                         },
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.blue",
-                                    "imported": "mypackage.utils.red",
-                                    "line_numbers": (8, 16),
-                                },
-                                {
-                                    "importer": "mypackage.utils.red",
-                                    "imported": "mypackage.utils.yellow",
-                                    "line_numbers": (2,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.yellow",
-                                    "imported": "mypackage.utils.brown",
-                                    "line_numbers": (None,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.brown",
-                                    "imported": "mypackage.high.green",
-                                    "line_numbers": (3,),
-                                },
+                                Link(
+                                    importer="mypackage.low.blue",
+                                    imported="mypackage.utils.red",
+                                    line_numbers=(8, 16),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.red",
+                                    imported="mypackage.utils.yellow",
+                                    line_numbers=(2,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.yellow",
+                                    imported="mypackage.utils.brown",
+                                    line_numbers=(None,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.brown",
+                                    imported="mypackage.high.green",
+                                    line_numbers=(3,),
+                                ),
                             ],
                             "extra_firsts": [
-                                {
-                                    "importer": "mypackage.low.purple",
-                                    "imported": "mypackage.utils.red",
-                                    "line_numbers": (11,),
-                                },
-                                {
-                                    "importer": "mypackage.low.white",
-                                    "imported": "mypackage.utils.red",
-                                    "line_numbers": (1,),
-                                },
+                                Link(
+                                    importer="mypackage.low.purple",
+                                    imported="mypackage.utils.red",
+                                    line_numbers=(11,),
+                                ),
+                                Link(
+                                    importer="mypackage.low.white",
+                                    imported="mypackage.utils.red",
+                                    line_numbers=(1,),
+                                ),
                             ],
                             "extra_lasts": [
-                                {
-                                    "importer": "mypackage.utils.brown",
-                                    "imported": "mypackage.high.black",
-                                    "line_numbers": (11,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.brown",
-                                    "imported": "mypackage.high.white",
-                                    "line_numbers": (8, 16),
-                                },
+                                Link(
+                                    importer="mypackage.utils.brown",
+                                    imported="mypackage.high.black",
+                                    line_numbers=(11,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.brown",
+                                    imported="mypackage.high.white",
+                                    line_numbers=(8, 16),
+                                ),
                             ],
                         },
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.purple",
-                                    "imported": "mypackage.utils.yellow",
-                                    "line_numbers": (9,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.yellow",
-                                    "imported": "mypackage.utils.brown",
-                                    "line_numbers": (None,),
-                                },
+                                Link(
+                                    importer="mypackage.low.purple",
+                                    imported="mypackage.utils.yellow",
+                                    line_numbers=(9,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.yellow",
+                                    imported="mypackage.utils.brown",
+                                    line_numbers=(None,),
+                                ),
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -1409,11 +1410,11 @@ def test_render_broken_contract():
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.low.blue",
-                                    "imported": "mypackage.medium.yellow",
-                                    "line_numbers": (6,),
-                                }
+                                Link(
+                                    importer="mypackage.low.blue",
+                                    imported="mypackage.medium.yellow",
+                                    line_numbers=(6,),
+                                )
                             ],
                             "extra_firsts": [],
                             "extra_lasts": [],
@@ -1426,35 +1427,35 @@ def test_render_broken_contract():
                     "routes": [
                         {
                             "chain": [
-                                {
-                                    "importer": "mypackage.medium.blue",
-                                    "imported": "mypackage.utils.yellow",
-                                    "line_numbers": (8,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.yellow",
-                                    "imported": "mypackage.utils.brown",
-                                    "line_numbers": (None,),
-                                },
-                                {
-                                    "importer": "mypackage.utils.brown",
-                                    "imported": "mypackage.high.green",
-                                    "line_numbers": (3,),
-                                },
+                                Link(
+                                    importer="mypackage.medium.blue",
+                                    imported="mypackage.utils.yellow",
+                                    line_numbers=(8,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.yellow",
+                                    imported="mypackage.utils.brown",
+                                    line_numbers=(None,),
+                                ),
+                                Link(
+                                    importer="mypackage.utils.brown",
+                                    imported="mypackage.high.green",
+                                    line_numbers=(3,),
+                                ),
                             ],
                             "extra_firsts": [
-                                {
-                                    "importer": "mypackage.medium.white",
-                                    "imported": "mypackage.utils.yellow",
-                                    "line_numbers": (1, 10),
-                                }
+                                Link(
+                                    importer="mypackage.medium.white",
+                                    imported="mypackage.utils.yellow",
+                                    line_numbers=(1, 10),
+                                )
                             ],
                             "extra_lasts": [
-                                {
-                                    "importer": "mypackage.utils.brown",
-                                    "imported": "mypackage.high.black",
-                                    "line_numbers": (11,),
-                                }
+                                Link(
+                                    importer="mypackage.utils.brown",
+                                    imported="mypackage.high.black",
+                                    line_numbers=(11,),
+                                )
                             ],
                         }
                     ],